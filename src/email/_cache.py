@@ -0,0 +1,65 @@
+"""On-disk cache for OpenAI completions."""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Optional
+
+
+class CompletionCache:
+    """SQLite-backed key-value store mapping prompt hashes to completions."""
+
+    def __init__(self, path: str = '.cache/openai.sqlite'):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS completions (key TEXT PRIMARY KEY, content TEXT NOT NULL)'
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(messages: list, model: str, temperature: float, max_tokens: int) -> str:
+        """
+        Hash everything that determines a completion into a cache key.
+
+        Args:
+            messages: List of message dicts
+            model: Model name
+            temperature: Sampling temperature
+            max_tokens: Output token limit
+
+        Returns:
+            str: Hex digest identifying the request
+        """
+        payload = json.dumps(
+            {'messages': messages, 'model': model, 'temperature': temperature, 'max_tokens': max_tokens},
+            sort_keys=True
+        )
+        return hashlib.blake2b(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached completion for key, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT content FROM completions WHERE key = ?', (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, content: str) -> None:
+        """Store a completion under key."""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO completions (key, content) VALUES (?, ?)', (key, content)
+            )
+            self._conn.commit()
@@ -0,0 +1,61 @@
+"""In-process semantic cache for emails of structurally similar venues."""
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class SemanticCache:
+    """Reuses completions for venues whose topic embeddings are near-identical."""
+
+    def __init__(self, threshold: float = 0.97):
+        """
+        Initialize an empty cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a cached completion to be reused
+        """
+        self.threshold = threshold
+        self._embeddings = None
+        self._entries = []
+
+    @staticmethod
+    def _normalize(embedding) -> np.ndarray:
+        """Convert an embedding to a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, embedding) -> Optional[Tuple[str, str]]:
+        """
+        Find the most similar cached completion.
+
+        Args:
+            embedding: Embedding of the venue text
+
+        Returns:
+            tuple: (venue_name, content) of the best match above threshold, or None
+        """
+        if self._embeddings is None:
+            return None
+
+        scores = self._embeddings @ self._normalize(embedding)
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+        return self._entries[best]
+
+    def add(self, embedding, venue_name: str, content: str) -> None:
+        """
+        Store a completion for later reuse.
+
+        Args:
+            embedding: Embedding of the venue text
+            venue_name: Venue the completion was written for
+            content: Raw completion text
+        """
+        vector = self._normalize(embedding)[np.newaxis, :]
+        if self._embeddings is None:
+            self._embeddings = vector
+        else:
+            self._embeddings = np.vstack([self._embeddings, vector])
+        self._entries.append((venue_name, content))
@@ -1,7 +1,11 @@
 """Email generation using OpenAI API."""
+import asyncio
+import functools
+import json
+import logging
 import time
-from typing import Dict, Optional
-from openai import OpenAI
+from typing import Dict, Optional, Tuple
+from openai import AsyncOpenAI, OpenAI
 from openai import (
     AuthenticationError,
     RateLimitError,
@@ -9,6 +13,111 @@ from openai import (
     APIError,
     APITimeoutError
 )
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential
+)
+
+from src.email._cache import CompletionCache
+from src.email._semantic_cache import SemanticCache
+
+logger = logging.getLogger(__name__)
+
+# Per-venue user message; filled with str.format_map in _build_user_message
+USER_PROMPT_TEMPLATE = """Write a direct proposal to the {venue_name} organizers to serve as a reviewer.
+
+CONFERENCE DETAILS:
+- Name: {venue_name}
+- Key Topics: {key_topics}
+- Conference Highlights: {highlights}
+
+USER CONTEXT:
+{profile_block}
+
+CONSTRAINTS:
+1. MATCHING: Identify exactly 2 intersections between the venue's topics ({key_topics}) and my expertise ({expertise_str}).
+2. TONE: Write as a peer offering a service, not a student asking for a spot.
+3. BREVITY: Max 150 words.
+4. STRUCTURE: 
+   - Sentence 1: Direct statement of intent.
+   - Sentence 2-3: Evidence of specific expertise matching their track.
+   - Sentence 4: The value I provide (e.g., "I can provide rigorous reviews for papers involving [Topic]").
+5. NO SIGN-OFF: End the text immediately after the last content sentence. Do NOT include "Sincerely," "Thank you," or your name.
+
+NEGATIVE CONSTRAINTS:
+- DO NOT use the phrase "I hope this message finds you well."
+- DO NOT list full paper titles in quotes; describe the contribution instead.
+- DO NOT use the word "passionate" or "keen."
+
+Email Body:"""
+
+
+def _is_no_match(content: str, complete: bool = True) -> bool:
+    """
+    Check whether a model reply is the "NULL" no-match sentinel.
+
+    Matches an upper-case "NULL" followed by a non-alphanumeric character
+    (e.g. "NULL." or "NULL\n..."), or a reply that is just "null" in any case.
+    The prefix rule is case-sensitive so that emails opening with the word
+    "Null" (e.g. "Null hypothesis tests...") are not dropped. Used by the
+    streaming, sync and Batch API paths alike.
+
+    Args:
+        content: Model reply, or a prefix of it at least 5 characters long
+        complete: False when content is only a streamed prefix, which may
+            continue past a lower-case "null" (default: True)
+
+    Returns:
+        bool: True if the reply means no matching interests
+    """
+    head = content.lstrip()
+    if complete and head.rstrip().upper() == 'NULL':
+        return True
+    return head[:4] == 'NULL' and len(head) > 4 and not head[4].isalnum()
+
+
+def _log_retry(retry_state):
+    """Report a transient OpenAI error before tenacity sleeps."""
+    error = retry_state.outcome.exception()
+    logger.warning(f"  {type(error).__name__}, retrying in {retry_state.next_action.sleep:.1f}s...")
+
+
+def _with_retries(func):
+    """
+    Retry rate-limit and connection errors with jittered exponential backoff.
+
+    Works on both sync and async EmailGenerator methods; the attempt limit is
+    read from the instance's max_retries at call time. Errors that survive the
+    retries are translated by EmailGenerator._translate_api_error.
+    """
+    def policy(self):
+        return {
+            'wait': wait_random_exponential(min=1, max=60),
+            'stop': stop_after_attempt(self.max_retries),
+            'retry': retry_if_exception_type((RateLimitError, APIConnectionError)),
+            'before_sleep': _log_retry,
+            'reraise': True
+        }
+
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            try:
+                return await AsyncRetrying(**policy(self))(func, self, *args, **kwargs)
+            except APIError as e:
+                raise self._translate_api_error(e) from e
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return Retrying(**policy(self))(func, self, *args, **kwargs)
+        except APIError as e:
+            raise self._translate_api_error(e) from e
+    return wrapper
 
 
 class EmailGenerator:
@@ -26,8 +135,9 @@ class EmailGenerator:
         if not api_key:
             raise ValueError("OpenAI API key is required")
 
-        # Initialize OpenAI client
+        # Initialize OpenAI clients (sync for direct callers, async for concurrent generation)
         self.client = OpenAI(api_key=api_key)
+        self.async_client = AsyncOpenAI(api_key=api_key)
         self.user_profile = user_profile
 
         # Configuration with defaults
@@ -38,7 +148,27 @@ class EmailGenerator:
         self.timeout = self.config.get('timeout', 30)
         self.max_retries = self.config.get('max_retries', 3)
 
-        print(f"Initialized EmailGenerator with model: {self.model}")
+        # Completions are cached on disk so re-runs skip unchanged prompts
+        if self.config.get('cache', True):
+            self.cache = CompletionCache(self.config.get('cache_path', '.cache/openai.sqlite'))
+        else:
+            self.cache = None
+
+        # Optional: reuse emails across venues with near-identical topics/highlights
+        self.embedding_model = self.config.get('embedding_model', 'text-embedding-3-small')
+        if self.config.get('semantic_cache', False):
+            self.semantic_cache = SemanticCache(self.config.get('semantic_cache_threshold', 0.97))
+        else:
+            self.semantic_cache = None
+
+        # Prompt pieces that do not depend on the venue are built once
+        # The system message dict is shared by reference across requests; its byte-identical
+        # prefix also lets OpenAI's automatic prompt caching kick in
+        self._system_msg_dict = {"role": "system", "content": self._build_system_message()}
+        self._profile_block, self._expertise_str = self._format_profile_once()
+        self._signature = self._build_signature()
+
+        logger.info(f"Initialized EmailGenerator with model: {self.model}")
 
     def _build_system_message(self) -> str:
         """
@@ -58,15 +188,12 @@ Your emails are:
 Tone: Collegial academic professional - enthusiastic but respectful.
 Focus on genuine interest and fit, not flattery."""
 
-    def _build_user_message(self, venue_info: Dict) -> str:
+    def _format_profile_once(self) -> Tuple[str, str]:
         """
-        Build the user message with venue and researcher details.
-
-        Args:
-            venue_info: Dictionary with venue information
+        Format the researcher profile section of the user message.
 
         Returns:
-            str: Formatted user message
+            tuple: (profile block for the prompt, formatted expertise string)
         """
         # Extract researcher info
         researcher_name = self.user_profile.get('name', 'the researcher')
@@ -90,49 +217,90 @@ Focus on genuine interest and fit, not flattery."""
         else:
             expertise_str = str(expertise)
 
-        # Extract venue info
-        venue_name = venue_info.get('name', 'the conference')
-        key_topics = venue_info.get('key_topics', '')
-        highlights = venue_info.get('highlights', '')
+        profile_block = (
+            f"- My Identity: {researcher_name}, {affiliation}. {identity}\n"
+            f"- Relevant Proof: {publications_str}\n"
+            f"- My Expertise: {expertise_str}"
+        )
+        return profile_block, expertise_str
 
-        # Truncate highlights if too long
-        if len(highlights) > 500:
-            highlights = highlights[:497] + "..."
+    def _build_signature(self) -> str:
+        """
+        Build the signature appended to every email.
 
-        prompt = f"""Write a direct proposal to the {venue_name} organizers to serve as a reviewer.
+        Returns:
+            str: Provided signature, or a default one generated from the name
+        """
+        signature = self.user_profile.get('signature', '')
+        if not signature:
+            # Generate default signature from name
+            researcher_name = self.user_profile.get('name', 'the researcher')
+            signature = f"Best regards,\n{researcher_name}"
+        return signature
 
-CONFERENCE DETAILS:
-- Name: {venue_name}
-- Key Topics: {key_topics}
-- Conference Highlights: {highlights}
+    def _build_user_message(self, venue_info: Dict) -> str:
+        """
+        Build the user message with venue and researcher details.
 
-USER CONTEXT:
-- My Identity: {researcher_name}, {affiliation}. {identity}
-- Relevant Proof: {publications_str}
-- My Expertise: {expertise_str}
+        Args:
+            venue_info: Dictionary with venue information
 
-CONSTRAINTS:
-1. MATCHING: Identify exactly 2 intersections between the venue's topics ({key_topics}) and my expertise ({expertise_str}).
-2. TONE: Write as a peer offering a service, not a student asking for a spot.
-3. BREVITY: Max 150 words.
-4. STRUCTURE: 
-   - Sentence 1: Direct statement of intent.
-   - Sentence 2-3: Evidence of specific expertise matching their track.
-   - Sentence 4: The value I provide (e.g., "I can provide rigorous reviews for papers involving [Topic]").
-5. NO SIGN-OFF: End the text immediately after the last content sentence. Do NOT include "Sincerely," "Thank you," or your name.
+        Returns:
+            str: Formatted user message
+        """
+        return USER_PROMPT_TEMPLATE.format_map({
+            'venue_name': venue_info.get('name', 'the conference'),
+            'key_topics': venue_info.get('key_topics', ''),
+            # Already truncated to 500 chars when the research row was built
+            'highlights': venue_info.get('highlights', ''),
+            'profile_block': self._profile_block,
+            'expertise_str': self._expertise_str
+        })
+
+    def _build_completion_params(self, messages: list) -> Dict:
+        """
+        Build keyword arguments for a chat completion request.
 
-NEGATIVE CONSTRAINTS:
-- DO NOT use the phrase "I hope this message finds you well."
-- DO NOT list full paper titles in quotes; describe the contribution instead.
-- DO NOT use the word "passionate" or "keen."
+        Args:
+            messages: List of message dicts
 
-Email Body:"""
+        Returns:
+            dict: Parameters for chat.completions.create
+        """
+        # Use max_completion_tokens for newer models (gpt-4o, gpt-4o-mini, etc.)
+        # Fall back to max_tokens for older models
+        completion_params = {
+            'model': self.model,
+            'messages': messages,
+            'temperature': self.temperature,
+            'timeout': self.timeout
+        }
+
+        # Newer models use max_completion_tokens
+        if 'gpt-4o' in self.model or 'gpt-5' in self.model or 'o1' in self.model:
+            completion_params['max_completion_tokens'] = self.max_tokens
+        else:
+            completion_params['max_tokens'] = self.max_tokens
+
+        return completion_params
+
+    def _cache_key(self, messages: list) -> Optional[str]:
+        """
+        Compute the completion cache key for a request.
+
+        Args:
+            messages: List of message dicts
 
-        return prompt
+        Returns:
+            str: Cache key, or None if caching is disabled
+        """
+        if self.cache is None:
+            return None
+        return CompletionCache.make_key(messages, self.model, self.temperature, self.max_tokens)
 
     def _call_openai_api(self, messages: list) -> str:
         """
-        Call OpenAI API with retry logic.
+        Call OpenAI API, serving repeated prompts from the completion cache.
 
         Args:
             messages: List of message dicts
@@ -144,56 +312,112 @@ Email Body:"""
             ValueError: Invalid API key
             RuntimeError: API errors after retries
         """
-        retry_delay = 1
+        cache_key = self._cache_key(messages)
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        email_content = self._create_completion(messages)
+        if cache_key:
+            self.cache.set(cache_key, email_content)
+        return email_content
 
-        for attempt in range(self.max_retries):
-            try:
-                # Use max_completion_tokens for newer models (gpt-4o, gpt-4o-mini, etc.)
-                # Fall back to max_tokens for older models
-                completion_params = {
-                    'model': self.model,
-                    'messages': messages,
-                    'temperature': self.temperature,
-                    'timeout': self.timeout
-                }
-
-                # Newer models use max_completion_tokens
-                if 'gpt-4o' in self.model or 'gpt-5' in self.model or 'o1' in self.model:
-                    completion_params['max_completion_tokens'] = self.max_tokens
-                else:
-                    completion_params['max_tokens'] = self.max_tokens
-
-                response = self.client.chat.completions.create(**completion_params)
-
-                email_content = response.choices[0].message.content
-                return email_content.strip()
-
-            except AuthenticationError as e:
-                raise ValueError(f"Invalid OpenAI API key: {e}")
-
-            except RateLimitError as e:
-                if attempt < self.max_retries - 1:
-                    print(f"  Rate limit hit, retrying in {retry_delay}s...")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2
-                else:
-                    raise RuntimeError(f"Rate limit exceeded after {self.max_retries} attempts: {e}")
-
-            except APIConnectionError as e:
-                if attempt < self.max_retries - 1:
-                    print(f"  Connection error, retrying in {retry_delay}s...")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2
-                else:
-                    raise RuntimeError(f"Connection failed after {self.max_retries} attempts: {e}")
-
-            except APITimeoutError as e:
-                raise RuntimeError(f"Request timeout after {self.timeout}s: {e}")
+    async def _call_openai_api_async(self, messages: list) -> str:
+        """
+        Call OpenAI API asynchronously, serving repeated prompts from the completion cache.
 
-            except APIError as e:
-                raise RuntimeError(f"OpenAI API error: {e}")
+        Args:
+            messages: List of message dicts
+
+        Returns:
+            str: Generated email content
+
+        Raises:
+            ValueError: Invalid API key
+            RuntimeError: API errors after retries
+        """
+        cache_key = self._cache_key(messages)
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        email_content = await self._create_completion_async(messages)
+        if cache_key:
+            self.cache.set(cache_key, email_content)
+        return email_content
+
+    @_with_retries
+    def _create_completion(self, messages: list) -> str:
+        """
+        Request a single chat completion.
 
-        raise RuntimeError("Failed to generate email after retries")
+        Args:
+            messages: List of message dicts
+
+        Returns:
+            str: Generated email content
+        """
+        response = self.client.chat.completions.create(**self._build_completion_params(messages))
+        return response.choices[0].message.content.strip()
+
+    @_with_retries
+    async def _create_completion_async(self, messages: list) -> str:
+        """
+        Stream a single chat completion without blocking the event loop.
+
+        The stream is abandoned as soon as the reply is recognisably the "NULL"
+        no-match sentinel, so no output tokens are spent on the rest of it.
+
+        Args:
+            messages: List of message dicts
+
+        Returns:
+            str: Generated email content ("NULL" if no matching interests)
+        """
+        stream = await self.async_client.chat.completions.create(
+            **self._build_completion_params(messages),
+            stream=True
+        )
+
+        parts = []
+        prefix_checked = False
+        async for chunk in stream:
+            if not chunk.choices or not chunk.choices[0].delta.content:
+                continue
+            parts.append(chunk.choices[0].delta.content)
+
+            if not prefix_checked:
+                head = ''.join(parts).lstrip()
+                # Need one character past "NULL" to tell it apart from e.g. "Nullable"
+                if len(head) > 4:
+                    prefix_checked = True
+                    if _is_no_match(head, complete=False):
+                        await stream.close()
+                        return 'NULL'
+
+        return ''.join(parts).strip()
+
+    def _translate_api_error(self, e: APIError) -> Exception:
+        """
+        Map an OpenAI SDK error to the exception raised to callers.
+
+        Args:
+            e: Error raised by the OpenAI SDK (after retries, if retryable)
+
+        Returns:
+            Exception: ValueError for an invalid key, RuntimeError otherwise
+        """
+        if isinstance(e, AuthenticationError):
+            return ValueError(f"Invalid OpenAI API key: {e}")
+        if isinstance(e, RateLimitError):
+            return RuntimeError(f"Rate limit exceeded after {self.max_retries} attempts: {e}")
+        if isinstance(e, APITimeoutError):
+            return RuntimeError(f"Request timeout after {self.timeout}s: {e}")
+        if isinstance(e, APIConnectionError):
+            return RuntimeError(f"Connection failed after {self.max_retries} attempts: {e}")
+        return RuntimeError(f"OpenAI API error: {e}")
 
     def generate_email(self, venue_info: Dict, research_data: Dict = None) -> Optional[str]:
         """
@@ -206,6 +430,233 @@ Email Body:"""
         Returns:
             str: Generated email content, or None if no matching interests
         """
+        messages = self._build_messages(venue_info)
+
+        embedding = None
+        if self.semantic_cache is not None:
+            embedding = self._embed_venue(venue_info)
+            reused = self._reuse_similar_email(venue_info, embedding)
+            if reused is not None:
+                return self._finalize_email(venue_info, reused)
+
+        # Generate email
+        logger.info(f"  Generating email for {venue_info.get('name')}...")
+        email_content = self._call_openai_api(messages)
+
+        if embedding is not None:
+            self.semantic_cache.add(embedding, venue_info['name'], email_content)
+
+        return self._finalize_email(venue_info, email_content)
+
+    async def generate_email_async(self, venue_info: Dict, research_data: Dict = None) -> Optional[str]:
+        """
+        Generate personalized email for a venue without blocking the event loop.
+
+        Args:
+            venue_info: Dictionary with venue information
+            research_data: Optional additional research data (unused)
+
+        Returns:
+            str: Generated email content, or None if no matching interests
+        """
+        messages = self._build_messages(venue_info)
+
+        embedding = None
+        if self.semantic_cache is not None:
+            embedding = await self._embed_venue_async(venue_info)
+            reused = self._reuse_similar_email(venue_info, embedding)
+            if reused is not None:
+                return self._finalize_email(venue_info, reused)
+
+        # Generate email
+        logger.info(f"  Generating email for {venue_info.get('name')}...")
+        email_content = await self._call_openai_api_async(messages)
+
+        if embedding is not None:
+            self.semantic_cache.add(embedding, venue_info['name'], email_content)
+
+        return self._finalize_email(venue_info, email_content)
+
+    def generate_emails_batch(self, venues: list) -> list:
+        """
+        Generate emails for many venues through the OpenAI Batch API.
+
+        Batch jobs are billed at half price but complete asynchronously
+        (within 24h), so this blocks while polling for the results.
+
+        Args:
+            venues: List of venue info dictionaries
+
+        Returns:
+            list: Email content (or None if no matching interests) per venue, in input order
+        """
+        completions = {}
+        lines = []
+        for idx, venue_info in enumerate(venues):
+            messages = self._build_messages(venue_info)
+            cache_key = self._cache_key(messages)
+            cached = self.cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                completions[idx] = cached
+                continue
+
+            body = self._build_completion_params(messages)
+            body.pop('timeout')  # Client-side option, not part of the request body
+            lines.append(json.dumps({
+                'custom_id': str(idx),
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': body
+            }))
+
+        if lines:
+            logger.info(f"  Submitting batch of {len(lines)} requests ({len(completions)} cached)...")
+            completions.update(self._run_batch(venues, lines))
+
+        return [
+            self._finalize_email(venue_info, completions[idx])
+            for idx, venue_info in enumerate(venues)
+        ]
+
+    def _run_batch(self, venues: list, lines: list) -> Dict[int, str]:
+        """
+        Upload a batch input file, wait for the job and parse its output.
+
+        Args:
+            venues: List of venue info dictionaries (indexed by custom_id)
+            lines: JSONL request lines
+
+        Returns:
+            dict: Completion text keyed by venue index
+
+        Raises:
+            RuntimeError: Batch did not complete or some requests failed
+        """
+        batch_input = ("\n".join(lines) + "\n").encode('utf-8')
+        input_file = self.client.files.create(
+            file=('email_batch.jsonl', batch_input),
+            purpose='batch'
+        )
+        batch = self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint='/v1/chat/completions',
+            completion_window='24h'
+        )
+        logger.info(f"  Batch {batch.id} submitted, waiting for completion...")
+
+        # Poll with exponential backoff until the batch reaches a terminal state
+        poll_delay = self.config.get('batch_poll_interval', 10)
+        max_poll_delay = self.config.get('batch_max_poll_interval', 300)
+        while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+            time.sleep(poll_delay)
+            poll_delay = min(poll_delay * 2, max_poll_delay)
+            batch = self.client.batches.retrieve(batch.id)
+            logger.info(f"  Batch status: {batch.status}")
+
+        if batch.status != 'completed' or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch.id} ended with status '{batch.status}'")
+
+        completions = {}
+        output = self.client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            idx = int(result['custom_id'])
+            response = result.get('response') or {}
+            if result.get('error') or response.get('status_code') != 200:
+                logger.error(f"  Batch request failed for {venues[idx].get('name')}: "
+                             f"{result.get('error') or response.get('body')}")
+                continue
+
+            email_content = response['body']['choices'][0]['message']['content'].strip()
+            cache_key = self._cache_key(self._build_messages(venues[idx]))
+            if cache_key:
+                self.cache.set(cache_key, email_content)
+            completions[idx] = email_content
+
+        missing = len(lines) - len(completions)
+        if missing:
+            raise RuntimeError(f"Batch {batch.id}: {missing} of {len(lines)} requests failed")
+
+        return completions
+
+    def _venue_text(self, venue_info: Dict) -> str:
+        """Text used to compare venues in the semantic cache."""
+        return f"{venue_info.get('key_topics', '')}\n{venue_info.get('highlights', '')}"
+
+    def _embed_venue(self, venue_info: Dict) -> Optional[list]:
+        """
+        Embed a venue's topics and highlights.
+
+        Args:
+            venue_info: Dictionary with venue information
+
+        Returns:
+            list: Embedding vector, or None if the request failed
+        """
+        try:
+            response = self.client.embeddings.create(
+                model=self.embedding_model,
+                input=self._venue_text(venue_info)
+            )
+            return response.data[0].embedding
+        except APIError as e:
+            logger.warning(f"  Embedding failed, skipping semantic cache: {e}")
+            return None
+
+    async def _embed_venue_async(self, venue_info: Dict) -> Optional[list]:
+        """
+        Embed a venue's topics and highlights without blocking the event loop.
+
+        Args:
+            venue_info: Dictionary with venue information
+
+        Returns:
+            list: Embedding vector, or None if the request failed
+        """
+        try:
+            response = await self.async_client.embeddings.create(
+                model=self.embedding_model,
+                input=self._venue_text(venue_info)
+            )
+            return response.data[0].embedding
+        except APIError as e:
+            logger.warning(f"  Embedding failed, skipping semantic cache: {e}")
+            return None
+
+    def _reuse_similar_email(self, venue_info: Dict, embedding: Optional[list]) -> Optional[str]:
+        """
+        Look up a completion written for a near-identical venue.
+
+        Args:
+            venue_info: Dictionary with venue information
+            embedding: Embedding of the venue text (None skips the lookup)
+
+        Returns:
+            str: Cached completion with the venue name substituted, or None on a miss
+        """
+        if embedding is None:
+            return None
+
+        match = self.semantic_cache.lookup(embedding)
+        if match is None:
+            return None
+
+        cached_venue, content = match
+        logger.info(f"  Reusing email written for similar venue {cached_venue}")
+        return content.replace(cached_venue, venue_info['name'])
+
+    def _build_messages(self, venue_info: Dict) -> list:
+        """
+        Validate venue info and build the chat messages for it.
+
+        Args:
+            venue_info: Dictionary with venue information
+
+        Returns:
+            list: System and user message dicts
+        """
         # Validate inputs
         if not venue_info:
             raise ValueError("venue_info is required")
@@ -214,30 +665,29 @@ Email Body:"""
             raise ValueError("venue_info must contain 'name'")
 
         # Build messages
-        system_message = self._build_system_message()
         user_message = self._build_user_message(venue_info)
 
-        messages = [
-            {"role": "system", "content": system_message},
+        return [
+            self._system_msg_dict,
             {"role": "user", "content": user_message}
         ]
 
-        # Generate email
-        print(f"  Generating email for {venue_info.get('name')}...")
-        email_content = self._call_openai_api(messages)
+    def _finalize_email(self, venue_info: Dict, email_content: str) -> Optional[str]:
+        """
+        Turn raw model output into the final email body.
 
+        Args:
+            venue_info: Dictionary with venue information
+            email_content: Text returned by the model
+
+        Returns:
+            str: Email body with signature, or None if no matching interests
+        """
         # Check if response is NULL (no matching interests)
-        if email_content.strip().upper() == "NULL":
-            print(f"    No matching interests - skipping")
+        if _is_no_match(email_content.rstrip()):
+            logger.info(f"    No matching interests for {venue_info.get('name')} - skipping")
             return None
 
-        # Add signature (use provided signature or generate default)
-        signature = self.user_profile.get('signature', '')
-        if not signature:
-            # Generate default signature from name
-            researcher_name = self.user_profile.get('name', 'the researcher')
-            signature = f"Best regards,\n{researcher_name}"
-
-        email_content = f"{email_content}\n\n{signature}"
+        email_content = f"{email_content}\n\n{self._signature}"
 
         return email_content
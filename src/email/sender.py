@@ -1,27 +1,183 @@
 """Email sending functionality."""
+import asyncio
+import logging
 import smtplib
+import threading
 import time
 import socket
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import aiosmtplib
+from email.header import Header
+from email.policy import SMTP as SMTP_POLICY
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
+from src.utils.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+# Seconds a persistent connection may sit idle before it is probed with NOOP
+KEEPALIVE_IDLE = 30
+
+# Persistent connections are recycled after this many messages or seconds
+MAX_MESSAGES_PER_CONNECTION = 100
+MAX_CONNECTION_AGE = 100
+
+# RFC 5322 limit on a line's length, excluding the CRLF; longer 7bit/8bit
+# bodies must be base64 or quoted-printable encoded
+MAX_LINE_OCTETS = 998
+
+# Header block for plain-text messages; filled per send instead of building a MIMEText
+RAW_TEMPLATE = (
+    b"From: %s\r\n"
+    b"To: %s\r\n"
+    b"Subject: %s\r\n"
+    b"MIME-Version: 1.0\r\n"
+    b"Content-Type: text/plain; charset=utf-8\r\n"
+    b"Content-Transfer-Encoding: %s\r\n"
+    b"\r\n"
+    b"%s"
+)
 
-class EmailSender:
-    """Sends emails via SMTP."""
 
-    def __init__(self, smtp_config, dry_run=False, rate_limit_delay=1.5):
+class EmailSender:
+    """
+    Sends emails via SMTP.
+
+    Each thread lazily opens one SMTP connection on its first send and reuses
+    it for following emails; connections are recycled periodically and closed
+    by close() or when leaving a `with` block. send_many spreads a batch over
+    pool_size worker threads. Used as an async context manager,
+    send_email_async shares a pool of up to pool_size connections between
+    concurrent sends.
+    """
+
+    def __init__(self, smtp_config, dry_run=False, rate_limit_delay=1.5, pool_size=5,
+                 rate=None, capacity=1):
         """
         Initialize the email sender.
 
         Args:
             smtp_config: Dictionary with SMTP configuration (host, port, use_tls, username, password)
             dry_run: If True, simulate sending without actually transmitting (default: False)
-            rate_limit_delay: Seconds to wait between emails (default: 1.5)
+            rate_limit_delay: Seconds between emails at the sustained rate; 0 disables rate limiting (default: 1.5)
+            pool_size: Maximum concurrent SMTP connections for send_many and async sends (default: 5)
+            rate: Sustained sends per second (default: 1 / rate_limit_delay)
+            capacity: Token-bucket size, i.e. sends allowed back-to-back after idling (default: 1)
         """
         self.smtp_config = smtp_config
         self.dry_run = dry_run
         self.rate_limit_delay = rate_limit_delay
-        self.last_send_time = 0
+        self.pool_size = pool_size
+
+        if not rate and rate_limit_delay > 0:
+            rate = 1 / rate_limit_delay
+        # No bucket means no spacing between sends
+        self._bucket = TokenBucket(rate, capacity) if rate else None
+
+        self._lock = threading.Lock()
+
+        # Persistent connection state, one slot per sending thread
+        self._local = threading.local()
+        self._slots = []
+        self._executor = None
+
+        # Async connection pool (only used inside an `async with` block)
+        self._async_pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def __del__(self):
+        # __init__ may not have completed
+        if getattr(self, '_slots', None):
+            self.close()
+
+    def close(self):
+        """Shut down send_many workers and close every persistent SMTP connection."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        with self._lock:
+            slots = list(self._slots)
+        for slot in slots:
+            self._close_slot(slot)
+
+    def _slot(self):
+        """Return the calling thread's connection slot, creating it on first use."""
+        slot = getattr(self._local, 'slot', None)
+        if slot is None:
+            slot = SimpleNamespace(conn=None, sent=0, opened_at=0, last_used=0)
+            self._local.slot = slot
+            with self._lock:
+                self._slots.append(slot)
+        return slot
+
+    def _close_slot(self, slot):
+        """Quit a slot's SMTP connection, if one is open."""
+        if slot.conn is None:
+            return
+        try:
+            slot.conn.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._drop_connection(slot)
+
+    def _drop_connection(self, slot=None):
+        """Forget a slot's connection without talking to the server."""
+        slot = slot or self._slot()
+        slot.conn = None
+        slot.sent = 0
+
+    def send_many(self, emails, from_email):
+        """
+        Send a batch of emails in parallel over pool_size SMTP connections.
+
+        Each worker thread keeps its own persistent connection; the rate limit
+        is shared by all of them.
+
+        Args:
+            emails: Iterable of dicts with to_email, subject and body
+            from_email: Sender email address
+
+        Returns:
+            list: True/False per email (sent successfully or not), in input order
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.pool_size)
+
+        futures = [
+            self._executor.submit(
+                self.send_email, email['to_email'], email['subject'], email['body'], from_email
+            )
+            for email in emails
+        ]
+        return [future.result() for future in futures]
+
+    async def __aenter__(self):
+        # Each slot holds a lazily opened connection; taking a slot bounds concurrency
+        self._async_pool = asyncio.LifoQueue()
+        for _ in range(self.pool_size):
+            self._async_pool.put_nowait(None)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        while not self._async_pool.empty():
+            smtp = self._async_pool.get_nowait()
+            if smtp is not None:
+                try:
+                    await smtp.quit()
+                except (aiosmtplib.SMTPException, OSError):
+                    pass
+        self._async_pool = None
+        return False
 
     def send_email(self, to_email, subject, body, from_email):
         """
@@ -47,11 +203,65 @@ class EmailSender:
         if self.dry_run:
             return self._dry_run_send(to_email, subject, body)
 
-        # Build MIME message
-        msg = self._build_message(to_email, subject, body, from_email)
-
         # Send via SMTP
-        return self._send_via_smtp(msg, to_email, subject)
+        return self._send_via_smtp(to_email, subject, body, from_email)
+
+    async def send_email_async(self, to_email, subject, body, from_email):
+        """
+        Send an email over a pooled async SMTP connection.
+
+        Must be called inside `async with EmailSender(...)`.
+
+        Args:
+            to_email: Recipient email address
+            subject: Email subject
+            body: Email body
+            from_email: Sender email address
+
+        Raises:
+            ValueError: Invalid inputs
+            aiosmtplib.SMTPException: Sending failed
+        """
+        # Input validation
+        if not self._validate_inputs(to_email, subject, body, from_email):
+            raise ValueError(f"Invalid email to {to_email}")
+
+        # Rate limiting
+        sleep_time = self._reserve_send_slot()
+        if sleep_time > 0:
+            await asyncio.sleep(sleep_time)
+
+        # Dry-run mode
+        if self.dry_run:
+            self._dry_run_send(to_email, subject, body)
+            return
+
+        smtp = await self._async_pool.get()
+        try:
+            if smtp is None or not smtp.is_connected:
+                smtp = await self._connect_async()
+            raw, mail_options = self._wire_message(
+                to_email, subject, body, from_email, smtp.supports_extension('8bitmime')
+            )
+            await smtp.sendmail(from_email, [to_email], raw, mail_options=mail_options)
+        except Exception as e:
+            logger.error(
+                f"✗ Failed to send email to {to_email}\n"
+                f"  Error: {type(e).__name__}: {str(e)}"
+            )
+            # Connection state is unknown after an error; reconnect on next use
+            if smtp is not None:
+                smtp.close()
+            smtp = None
+            raise
+        finally:
+            self._async_pool.put_nowait(smtp)
+
+        # Log success
+        logger.info(
+            f"✓ Sent email to {to_email}\n"
+            f"  Subject: {subject}"
+        )
 
     def _validate_inputs(self, to_email, subject, body, from_email):
         """
@@ -68,29 +278,35 @@ class EmailSender:
         """
         # Check for empty values
         if not to_email or not subject or not body or not from_email:
-            print("✗ Validation error: Missing required fields")
+            logger.warning("✗ Validation error: Missing required fields")
             return False
 
         # Basic email format validation
         if '@' not in to_email or '.' not in to_email.split('@')[-1]:
-            print(f"✗ Validation error: Invalid recipient email format: {to_email}")
+            logger.warning(f"✗ Validation error: Invalid recipient email format: {to_email}")
             return False
 
         if '@' not in from_email or '.' not in from_email.split('@')[-1]:
-            print(f"✗ Validation error: Invalid sender email format: {from_email}")
+            logger.warning(f"✗ Validation error: Invalid sender email format: {from_email}")
             return False
 
         return True
 
     def _apply_rate_limit(self):
         """Apply rate limiting by sleeping if necessary."""
-        if self.last_send_time > 0:
-            elapsed = time.time() - self.last_send_time
-            if elapsed < self.rate_limit_delay:
-                sleep_time = self.rate_limit_delay - elapsed
-                time.sleep(sleep_time)
+        if self._bucket is not None:
+            self._bucket.acquire()
+
+    def _reserve_send_slot(self):
+        """
+        Take one token from the rate-limit bucket without sleeping.
 
-        self.last_send_time = time.time()
+        Returns:
+            float: Seconds to wait before sending
+        """
+        if self._bucket is None:
+            return 0
+        return self._bucket.reserve()
 
     def _dry_run_send(self, to_email, subject, body):
         """
@@ -104,10 +320,12 @@ class EmailSender:
         Returns:
             bool: Always returns True (simulated success)
         """
-        print(f"[DRY RUN] Would send email to {to_email}")
-        print(f"  Subject: {subject}")
         body_preview = body[:100] + "..." if len(body) > 100 else body
-        print(f"  Body preview: {body_preview}")
+        logger.info(
+            f"[DRY RUN] Would send email to {to_email}\n"
+            f"  Subject: {subject}\n"
+            f"  Body preview: {body_preview}"
+        )
         return True
 
     def _build_message(self, to_email, subject, body, from_email):
@@ -123,79 +341,244 @@ class EmailSender:
         Returns:
             MIMEText: Constructed email message
         """
-        msg = MIMEText(body, 'plain')
+        msg = MIMEText(body, 'plain', 'utf-8', policy=SMTP_POLICY)
         msg['From'] = from_email
         msg['To'] = to_email
-        msg['Subject'] = subject
+        # Line breaks would start a new header
+        msg['Subject'] = ' '.join(subject.splitlines())
         return msg
 
-    def _send_via_smtp(self, msg, to_email, subject):
+    def _wire_message(self, to_email, subject, body, from_email, supports_8bitmime):
         """
-        Send email via SMTP with error handling.
+        Encode an email for a particular SMTP connection.
+
+        ASCII bodies and servers advertising 8BITMIME get the cheap raw form;
+        otherwise, or when a body line is too long to send unencoded, the
+        body is base64-encoded through _build_message.
 
         Args:
-            msg: MIME message object
-            to_email: Recipient email address (for logging)
-            subject: Email subject (for logging)
+            to_email: Recipient email address
+            subject: Email subject
+            body: Email body
+            from_email: Sender email address
+            supports_8bitmime: Whether the server advertises 8BITMIME
 
         Returns:
-            bool: True if sent successfully, False otherwise
+            tuple: (message bytes, mail_options for sendmail)
         """
-        try:
-            # Connect to SMTP server
-            server = smtplib.SMTP(
-                self.smtp_config['host'],
-                self.smtp_config['port'],
-                timeout=30
-            )
+        long_line = any(
+            len(line.encode('utf-8')) > MAX_LINE_OCTETS
+            for line in body.replace('\r\n', '\n').split('\n')
+        )
+        if not long_line:
+            if body.isascii():
+                return self._build_raw(to_email, subject, body, from_email), ()
+            if supports_8bitmime:
+                return self._build_raw(to_email, subject, body, from_email), ('BODY=8BITMIME',)
+        return self._build_message(to_email, subject, body, from_email).as_bytes(), ()
+
+    def _build_raw(self, to_email, subject, body, from_email):
+        """
+        Build the wire form of a plain text email from RAW_TEMPLATE.
 
-            # Start TLS if enabled
-            if self.smtp_config.get('use_tls', True):
-                server.starttls()
+        Cheaper than _build_message, which remains for richer messages.
+        Non-ASCII bodies are sent as 8bit and need an 8BITMIME server.
 
-            # Login with credentials
-            server.login(
-                self.smtp_config['username'],
-                self.smtp_config['password']
-            )
+        Args:
+            to_email: Recipient email address
+            subject: Email subject
+            body: Email body
+            from_email: Sender email address
+
+        Returns:
+            bytes: Message ready for sendmail
+        """
+        body = body.replace('\r\n', '\n').replace('\n', '\r\n')
+        if not body.endswith('\r\n'):
+            body += '\r\n'
+        return RAW_TEMPLATE % (
+            self._encode_header(from_email),
+            self._encode_header(to_email),
+            self._encode_header(subject),
+            b'7bit' if body.isascii() else b'8bit',
+            body.encode('utf-8')
+        )
+
+    @staticmethod
+    def _encode_header(value):
+        """
+        Encode a header value, using RFC 2047 only when it is not plain ASCII.
+
+        Args:
+            value: Header value
+
+        Returns:
+            bytes: ASCII header value
+        """
+        # Line breaks would start a new header
+        value = ' '.join(value.splitlines())
+        if value.isascii():
+            return value.encode('ascii')
+        # Fold with CRLF to match the rest of the message; a bare LF gets rejected
+        return Header(value, 'utf-8').encode(linesep='\r\n').encode('ascii')
+
+    def _connect(self):
+        """
+        Open an authenticated SMTP connection.
+
+        Returns:
+            smtplib.SMTP: Connected and logged-in server
+        """
+        # Connect to SMTP server
+        server = smtplib.SMTP(
+            self.smtp_config['host'],
+            self.smtp_config['port'],
+            timeout=30
+        )
+
+        # Start TLS if enabled
+        if self.smtp_config.get('use_tls', True):
+            server.starttls()
+
+        # Login with credentials
+        server.login(
+            self.smtp_config['username'],
+            self.smtp_config['password']
+        )
+
+        return server
+
+    async def _connect_async(self):
+        """
+        Open an authenticated async SMTP connection.
 
-            # Send email
-            server.send_message(msg)
+        Returns:
+            aiosmtplib.SMTP: Connected and logged-in server
+        """
+        smtp = aiosmtplib.SMTP(
+            hostname=self.smtp_config['host'],
+            port=self.smtp_config['port'],
+            start_tls=self.smtp_config.get('use_tls', True),
+            timeout=30
+        )
+        await smtp.connect()
+        await smtp.login(
+            self.smtp_config['username'],
+            self.smtp_config['password']
+        )
+        return smtp
+
+    def _get_connection(self):
+        """
+        Return the calling thread's SMTP connection, opening or reviving it as needed.
 
-            # Close connection
-            server.quit()
+        Returns:
+            smtplib.SMTP: Connected and logged-in server
+        """
+        slot = self._slot()
+        if slot.conn is not None and time.monotonic() - slot.last_used > KEEPALIVE_IDLE:
+            # Probe idle connections; servers drop them silently after a while
+            try:
+                status, _ = slot.conn.noop()
+            except (smtplib.SMTPException, OSError):
+                status = None
+            if status != 250:
+                self._close_slot(slot)
+
+        if slot.conn is None:
+            slot.conn = self._connect()
+            slot.sent = 0
+            slot.opened_at = time.monotonic()
+            slot.last_used = slot.opened_at
+
+        return slot.conn
+
+    def _release_connection(self):
+        """Record a send on the calling thread's connection and recycle it when due."""
+        slot = self._slot()
+        slot.sent += 1
+        slot.last_used = time.monotonic()
+        if (slot.sent >= MAX_MESSAGES_PER_CONNECTION
+                or slot.last_used - slot.opened_at > MAX_CONNECTION_AGE):
+            self._close_slot(slot)
+
+    def _send_via_smtp(self, to_email, subject, body, from_email):
+        """
+        Send email via SMTP with error handling.
+
+        Args:
+            to_email: Recipient email address
+            subject: Email subject
+            body: Email body
+            from_email: Sender email address
+
+        Returns:
+            bool: True if sent successfully, False otherwise
+        """
+        try:
+            server = self._get_connection()
+            try:
+                raw, mail_options = self._wire_message(
+                    to_email, subject, body, from_email, server.has_extn('8bitmime')
+                )
+                server.sendmail(from_email, [to_email], raw, mail_options)
+            except smtplib.SMTPServerDisconnected:
+                # The cached connection went stale; reconnect and retry once
+                self._drop_connection()
+                server = self._get_connection()
+                raw, mail_options = self._wire_message(
+                    to_email, subject, body, from_email, server.has_extn('8bitmime')
+                )
+                server.sendmail(from_email, [to_email], raw, mail_options)
+            self._release_connection()
 
             # Log success
-            print(f"✓ Sent email to {to_email}")
-            print(f"  Subject: {subject}")
+            logger.info(
+                f"✓ Sent email to {to_email}\n"
+                f"  Subject: {subject}"
+            )
 
             return True
 
         except smtplib.SMTPAuthenticationError as e:
-            print(f"✗ Failed to send email to {to_email}")
-            print(f"  Error: SMTPAuthenticationError - Invalid credentials")
-            print(f"  Details: {str(e)}")
+            logger.error(
+                f"✗ Failed to send email to {to_email}\n"
+                f"  Error: SMTPAuthenticationError - Invalid credentials\n"
+                f"  Details: {str(e)}"
+            )
             return False
 
         except smtplib.SMTPServerDisconnected as e:
-            print(f"✗ Failed to send email to {to_email}")
-            print(f"  Error: SMTPServerDisconnected - Connection lost")
-            print(f"  Details: {str(e)}")
+            # Drop the dead connection so the next send reconnects
+            self._drop_connection()
+            logger.error(
+                f"✗ Failed to send email to {to_email}\n"
+                f"  Error: SMTPServerDisconnected - Connection lost\n"
+                f"  Details: {str(e)}"
+            )
             return False
 
         except smtplib.SMTPException as e:
-            print(f"✗ Failed to send email to {to_email}")
-            print(f"  Error: SMTPException - SMTP protocol error")
-            print(f"  Details: {str(e)}")
+            logger.error(
+                f"✗ Failed to send email to {to_email}\n"
+                f"  Error: SMTPException - SMTP protocol error\n"
+                f"  Details: {str(e)}"
+            )
             return False
 
         except socket.gaierror as e:
-            print(f"✗ Failed to send email to {to_email}")
-            print(f"  Error: gaierror - DNS/Network error")
-            print(f"  Details: {str(e)}")
+            logger.error(
+                f"✗ Failed to send email to {to_email}\n"
+                f"  Error: gaierror - DNS/Network error\n"
+                f"  Details: {str(e)}"
+            )
             return False
 
         except Exception as e:
-            print(f"✗ Failed to send email to {to_email}")
-            print(f"  Error: {type(e).__name__}: {str(e)}")
+            # Connection state is unknown after an unexpected error; start fresh next time
+            self._close_slot(self._slot())
+            logger.error(
+                f"✗ Failed to send email to {to_email}\n"
+                f"  Error: {type(e).__name__}: {str(e)}"
+            )
             return False
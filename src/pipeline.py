@@ -0,0 +1,457 @@
+"""Shared scrape -> research -> generate -> send pipeline."""
+import asyncio
+import copy
+import functools
+import logging
+import os
+
+import aiohttp
+import yaml
+from dotenv import load_dotenv
+
+try:
+    # libyaml C bindings parse several times faster than the pure-Python loader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+from src.scraper.openreview_scraper import EXCLUDED_EMAIL_KEYWORDS, OpenReviewScraper
+from src.research.venue_researcher import VenueResearcher
+from src.email.generator import EmailGenerator
+from src.email.sender import EmailSender
+from src.utils.csv_handler import CsvStreamWriter, save_to_csv
+from src.utils.dedup import dedup_by_url
+from src.utils.logging_setup import flush_logging
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of concurrent Exa.ai requests (kept below Exa's rate limit)
+EXA_CONCURRENCY = 8
+
+# Default number of concurrent OpenAI requests (override with email_generation.concurrency)
+OPENAI_CONCURRENCY = 8
+
+# CSV columns for scraped conferences, venue research and generated emails
+CONFERENCE_FIELDS = ['name', 'url', 'email']
+VENUE_RESEARCH_FIELDS = ['name', 'url', 'email', 'key_topics', 'highlights']
+EMAIL_FIELDS = ['venue_name', 'to_email', 'subject', 'body']
+
+# Email body recorded for venues whose topics do not match the user's interests
+NO_MATCH_BODY = 'No match - interests do not align'
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_files():
+    """Parse the YAML config files once per process."""
+    load_dotenv()
+
+    with open('config/config.yaml', 'r') as f:
+        config = yaml.load(f, Loader=SafeLoader)
+
+    with open('config/user_profile.yaml', 'r') as f:
+        user_profile = yaml.load(f, Loader=SafeLoader)
+
+    return config, user_profile
+
+
+def load_config():
+    """
+    Load configuration from YAML files and environment variables.
+
+    Files are parsed only on the first call; every call returns fresh copies
+    so callers can adjust their config without affecting later loads.
+    """
+    config, user_profile = _load_config_files()
+    return copy.deepcopy(config), copy.deepcopy(user_profile)
+
+
+def format_venue_research(conf, research_data):
+    """Flatten Exa.ai research results into a CSV-ready venue row."""
+    # Format highlights and topics for CSV storage
+    # Highlights are truncated only here; EmailGenerator uses them as-is in the prompt
+    highlights_text = " | ".join(research_data['highlights'][:5])  # Max 5 highlights
+    if len(highlights_text) > 500:
+        highlights_text = highlights_text[:497] + "..."
+
+    topics_text = ", ".join(research_data['key_topics'])
+
+    return {
+        'name': conf['name'],
+        'url': conf['url'],
+        'email': conf['email'],
+        'key_topics': topics_text,
+        'highlights': highlights_text
+    }
+
+
+async def _bounded(sem, coro):
+    """Await a coroutine while holding a semaphore slot."""
+    async with sem:
+        return await coro
+
+
+async def research_venues_async(researcher, conferences, concurrency=EXA_CONCURRENCY,
+                                research_writer=None):
+    """
+    Research all conferences concurrently with Exa.ai.
+
+    Args:
+        researcher: VenueResearcher instance
+        conferences: List of conference dicts with name, url and email
+        concurrency: Maximum number of in-flight Exa.ai requests
+        research_writer: Optional CsvStreamWriter that receives each row as it completes
+
+    Returns:
+        list: Venue research rows, in the same order as conferences
+    """
+    total = len(conferences)
+    sem = asyncio.Semaphore(concurrency)
+
+    async def research_one(idx, conf):
+        logger.info(f"[{idx}/{total}] {conf['name']}")
+        research_data = await researcher.research_venue_async(session, conf['name'], conf['url'])
+        venue = format_venue_research(conf, research_data)
+        if research_writer:
+            research_writer.writerow(venue)
+        return venue
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        return await asyncio.gather(*[
+            _bounded(sem, research_one(idx, conf))
+            for idx, conf in enumerate(conferences, 1)
+        ])
+
+
+def format_email(venue, email_content):
+    """Build the emails.csv row for a venue from generated content (None means no match)."""
+    return {
+        'venue_name': venue['name'],
+        'to_email': venue['email'],
+        'subject': f"Reviewer Opportunity - {venue['name']}",
+        # No matching interests - keep the row but mark it as skipped
+        'body': email_content if email_content else NO_MATCH_BODY
+    }
+
+
+async def research_and_generate_async(researcher, generator, conferences,
+                                      research_concurrency=EXA_CONCURRENCY,
+                                      generate_concurrency=OPENAI_CONCURRENCY,
+                                      research_writer=None, email_writer=None):
+    """
+    Research venues and generate emails as a producer-consumer pipeline.
+
+    Each venue is handed to an email-generation worker as soon as its Exa.ai
+    research completes, so OpenAI calls overlap with outstanding Exa.ai calls.
+
+    Args:
+        researcher: VenueResearcher instance
+        generator: EmailGenerator instance
+        conferences: List of conference dicts with name, url and email
+        research_concurrency: Maximum number of in-flight Exa.ai requests
+        generate_concurrency: Number of email-generation workers
+        research_writer: Optional CsvStreamWriter that receives each venue row as it completes
+        email_writer: Optional CsvStreamWriter that receives each email row as it completes
+
+    Returns:
+        tuple: (venue research rows, email rows), both in conference order
+    """
+    total = len(conferences)
+    research_q = asyncio.Queue()
+    out_q = asyncio.Queue()
+    sem = asyncio.Semaphore(research_concurrency)
+
+    async def research_one(session, idx, conf):
+        async with sem:
+            logger.info(f"[{idx}/{total}] {conf['name']}")
+            research_data = await researcher.research_venue_async(session, conf['name'], conf['url'])
+        venue = format_venue_research(conf, research_data)
+        if research_writer:
+            research_writer.writerow(venue)
+        await research_q.put((idx, venue))
+
+    async def produce(session):
+        await asyncio.gather(*[
+            research_one(session, idx, conf)
+            for idx, conf in enumerate(conferences, 1)
+        ])
+        # One sentinel per worker signals that research is finished
+        for _ in range(generate_concurrency):
+            await research_q.put(None)
+
+    async def consume():
+        while True:
+            item = await research_q.get()
+            if item is None:
+                break
+            idx, venue = item
+            email_content = await generator.generate_email_async(venue, venue)
+            email = format_email(venue, email_content)
+            if email_writer:
+                email_writer.writerow(email)
+            await out_q.put((idx, venue, email))
+
+    connector = aiohttp.TCPConnector(limit=research_concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await asyncio.gather(
+            produce(session),
+            *[consume() for _ in range(generate_concurrency)]
+        )
+
+    results = sorted(
+        (out_q.get_nowait() for _ in range(out_q.qsize())),
+        key=lambda result: result[0]
+    )
+    venue_research = [venue for _, venue, _ in results]
+    emails = [email for _, _, email in results]
+    return venue_research, emails
+
+
+async def send_emails_async(sender, emails, from_email):
+    """
+    Send all matched emails concurrently over the sender's SMTP connection pool.
+
+    Args:
+        sender: EmailSender instance
+        emails: List of email rows
+        from_email: Sender email address
+
+    Returns:
+        tuple: (sent count, failed count)
+    """
+    # Skip emails with no matching interests
+    to_send = [email for email in emails if email['body'] != NO_MATCH_BODY]
+
+    async with sender:
+        results = await asyncio.gather(*[
+            sender.send_email_async(email['to_email'], email['subject'], email['body'], from_email)
+            for email in to_send
+        ], return_exceptions=True)
+
+    failed_count = sum(1 for result in results if isinstance(result, Exception))
+    return len(to_send) - failed_count, failed_count
+
+
+async def _scrape_conferences(config, num_conferences=None):
+    """Phase 1: Scrape OpenReview for conferences and emails."""
+    logger.info("=" * 60)
+    logger.info("PHASE 1: Scraping OpenReview Conferences")
+    logger.info("=" * 60)
+
+    scraping = config['scraping']
+    scraper = OpenReviewScraper(
+        cache_path=scraping.get('cache_path', '.cache/openreview.sqlite') if scraping.get('cache', True) else None,
+        cache_expire_after=scraping.get('cache_expire_after', 3600),
+        excluded_keywords=scraping.get('excluded_email_keywords', EXCLUDED_EMAIL_KEYWORDS)
+    )
+    all_conferences = await asyncio.to_thread(scraper.scrape_open_submissions)
+    conferences = all_conferences[:num_conferences] if num_conferences else all_conferences
+
+    save_to_csv(
+        conferences,
+        config['output']['conferences_csv'],
+        fieldnames=CONFERENCE_FIELDS
+    )
+
+    logger.info(f"✓ Scraped {len(all_conferences)} conferences")
+    if len(conferences) < len(all_conferences):
+        logger.info(f"✓ Processing first {len(conferences)} conferences")
+    logger.info(f"✓ Saved to {config['output']['conferences_csv']}")
+    return conferences
+
+
+async def _research_and_generate(config, user_profile, conferences, batch=False):
+    """
+    Phases 2+3: Research venues and generate emails in one pipeline.
+
+    With batch=True, all venues are researched first and the emails are then
+    generated in a single OpenAI Batch API job (half price, up to 24h latency).
+    """
+    logger.info("\n" + "=" * 60)
+    logger.info("PHASE 2+3: Researching Venues and Generating Emails")
+    logger.info("=" * 60)
+
+    # Skip duplicate venues before paying for Exa.ai and OpenAI calls
+    unique_conferences = dedup_by_url(conferences)
+    if len(unique_conferences) < len(conferences):
+        logger.info(f"Skipping {len(conferences) - len(unique_conferences)} duplicate conferences")
+    conferences = unique_conferences
+
+    exa_api_key = os.getenv('EXA_API_KEY')
+    if not exa_api_key:
+        logger.error("ERROR: EXA_API_KEY not found in environment variables")
+        return [], []
+
+    openai_api_key = os.getenv('OPENAI_API_KEY')
+    if not openai_api_key:
+        logger.error("ERROR: OPENAI_API_KEY not found in environment variables")
+        return [], []
+
+    researcher = VenueResearcher(exa_api_key)
+    email_config = config['email_generation']
+    generator = EmailGenerator(openai_api_key, user_profile, email_config)
+
+    # Rows are streamed to both CSVs as they complete (in completion order)
+    with CsvStreamWriter(config['output']['venue_research_csv'], VENUE_RESEARCH_FIELDS) as research_writer, \
+            CsvStreamWriter(config['output']['emails_csv'], EMAIL_FIELDS) as email_writer:
+        if batch:
+            venue_research = await research_venues_async(
+                researcher, conferences, research_writer=research_writer
+            )
+            email_contents = await asyncio.to_thread(generator.generate_emails_batch, venue_research)
+            emails = [
+                format_email(venue, email_content)
+                for venue, email_content in zip(venue_research, email_contents)
+            ]
+            email_writer.writerows(emails)
+        else:
+            concurrency = email_config.get('concurrency', OPENAI_CONCURRENCY)
+            venue_research, emails = await research_and_generate_async(
+                researcher, generator, conferences, generate_concurrency=concurrency,
+                research_writer=research_writer, email_writer=email_writer
+            )
+    skipped = sum(1 for email in emails if email['body'] == NO_MATCH_BODY)
+
+    logger.info(f"\n✓ Researched {len(venue_research)} venues")
+    logger.info(f"✓ Saved to {config['output']['venue_research_csv']}")
+    logger.info(f"✓ Generated {len(emails) - skipped} personalized emails")
+    logger.info(f"✓ Skipped {skipped} venues (no matching interests)")
+    logger.info(f"✓ Saved to {config['output']['emails_csv']}")
+    return venue_research, emails
+
+
+def _preview_emails(emails):
+    """Print a short preview of every generated email."""
+    logger.info("\n" + "=" * 60)
+    logger.info("EMAIL PREVIEW")
+    logger.info("=" * 60)
+
+    for idx, email in enumerate(emails, 1):
+        logger.info(f"\n[{idx}] {email['venue_name']}")
+        if email['body'] == NO_MATCH_BODY:
+            logger.info(f"    ⊘ SKIPPED - No matching interests")
+        else:
+            logger.info(f"    TO: {email['to_email']}")
+            logger.info(f"    SUBJECT: {email['subject']}")
+            preview = email['body'][:150] + "..." if len(email['body']) > 150 else email['body']
+            logger.info(f"    BODY: {preview}")
+
+
+def _confirm_send(emails, dry_run):
+    """
+    Ask the user to confirm phase 4.
+
+    Real sends require typing 'SEND'; dry runs only need 'yes'.
+
+    Returns:
+        bool: True if sending should proceed
+    """
+    to_send = sum(1 for email in emails if email['body'] != NO_MATCH_BODY)
+
+    logger.info("\n" + "=" * 60)
+    if dry_run:
+        logger.info("READY TO SIMULATE SENDING (DRY RUN)")
+    else:
+        logger.info("⚠️  READY TO SEND REAL EMAILS")
+    logger.info("=" * 60)
+    logger.info(f"Total emails to send: {to_send}")
+    logger.info(f"Skipped (no match): {len(emails) - to_send}")
+
+    if dry_run:
+        # Make sure the summary is on screen before prompting
+        flush_logging()
+        response = input("\nSimulate sending? (yes/no): ")
+        return response.lower().strip() == 'yes'
+
+    logger.info("\nThese emails will be sent to real recipients!")
+    flush_logging()
+    response = input("\nProceed with sending? (type 'SEND' to confirm, anything else to cancel): ")
+    return response.strip() == 'SEND'
+
+
+async def _send_emails(config, user_profile, emails, dry_run=True):
+    """Phase 4: Send emails via SMTP."""
+    logger.info("\n" + "=" * 60)
+    if dry_run:
+        logger.info("PHASE 4: Sending Emails (DRY RUN MODE)")
+    else:
+        logger.info("PHASE 4: Sending Emails (LIVE MODE)")
+    logger.info("=" * 60)
+
+    smtp_config = {
+        'host': config['smtp']['host'],
+        'port': config['smtp']['port'],
+        'use_tls': config['smtp']['use_tls'],
+        'username': os.getenv('EMAIL_ADDRESS'),
+        'password': os.getenv('EMAIL_PASSWORD')
+    }
+
+    sender = EmailSender(
+        smtp_config,
+        dry_run=dry_run,
+        pool_size=config['smtp'].get('pool_size', 5),
+        capacity=config['smtp'].get('burst', 1)
+    )
+    sent_count, failed_count = await send_emails_async(sender, emails, user_profile['email'])
+
+    if dry_run:
+        logger.info(f"\n✓ [DRY RUN] Simulated {sent_count}/{len(emails)} emails")
+    else:
+        logger.info(f"\n✓ Sent {sent_count}/{len(emails)} emails successfully")
+    return sent_count, failed_count
+
+
+async def run_pipeline(config, user_profile, num_conferences=None, dry_run=True,
+                       interactive_confirm=True, batch=False):
+    """
+    Run all four phases: scrape, research, generate and send.
+
+    Args:
+        config: Application configuration dict
+        user_profile: User profile dict
+        num_conferences: Only process the first N scraped conferences (default: all)
+        dry_run: Simulate phase 4 instead of sending real emails (default: True)
+        interactive_confirm: Preview emails and ask before phase 4 (default: True)
+        batch: Generate emails with the OpenAI Batch API (default: False)
+
+    Returns:
+        list: Email rows produced by phase 3
+    """
+    # Phase 1: Scrape conferences
+    conferences = await _scrape_conferences(config, num_conferences)
+
+    # Phases 2+3: Research venues and generate emails (pipelined)
+    venue_research, emails = await _research_and_generate(
+        config, user_profile, conferences, batch=batch
+    )
+    skipped = sum(1 for email in emails if email['body'] == NO_MATCH_BODY)
+
+    # Phase 4: Send emails
+    if interactive_confirm:
+        _preview_emails(emails)
+        if not _confirm_send(emails, dry_run):
+            logger.info("\n❌ Cancelled. No emails sent.")
+            logger.info(f"✓ Generated emails saved to {config['output']['emails_csv']} for review")
+            return emails
+
+    sent_count, failed_count = await _send_emails(config, user_profile, emails, dry_run=dry_run)
+
+    # Final summary
+    logger.info("\n" + "=" * 60)
+    logger.info("RUN SUMMARY")
+    logger.info("=" * 60)
+    logger.info(f"✓ Phase 1: Scraped {len(conferences)} conferences")
+    logger.info(f"✓ Phase 2: Researched {len(venue_research)} venues")
+    logger.info(f"✓ Phase 3: Generated {len(emails) - skipped} emails ({skipped} skipped)")
+    if dry_run:
+        logger.info(f"✓ Phase 4: Simulated {sent_count} emails (dry run)")
+    else:
+        logger.info(f"✓ Phase 4: Sent {sent_count} emails successfully")
+    if failed_count > 0:
+        logger.error(f"✗ Phase 4: {failed_count} emails failed to send")
+
+    logger.info("\nOutput files:")
+    logger.info(f"  - {config['output']['conferences_csv']}")
+    logger.info(f"  - {config['output']['venue_research_csv']}")
+    logger.info(f"  - {config['output']['emails_csv']}")
+    return emails
@@ -1,6 +1,46 @@
 """Venue research using Exa.ai API."""
+import asyncio
+import functools
+import logging
+
+import ahocorasick
+import aiohttp
 from exa_py import Exa
 
+EXA_SEARCH_URL = "https://api.exa.ai/search"
+
+# Topic keywords to look for in research highlights
+TOPIC_KEYWORDS = {
+    "Machine Learning": ["machine learning", "ml", "deep learning", "neural network"],
+    "Natural Language Processing": ["nlp", "natural language", "language model", "text mining"],
+    "Computer Vision": ["computer vision", "image processing", "visual", "cv"],
+    "AI": ["artificial intelligence", "ai"],
+    "Theory": ["theory", "theoretical", "algorithm"],
+    "Data Science": ["data science", "data mining", "analytics"],
+    "Robotics": ["robotics", "robot", "autonomous"],
+    "Healthcare": ["healthcare", "medical", "clinical", "health"],
+    "Security": ["security", "privacy", "cryptography"],
+    "Systems": ["systems", "distributed", "cloud", "infrastructure"]
+}
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=1)
+def _topic_automaton():
+    """
+    Build the Aho-Corasick automaton over TOPIC_KEYWORDS once per process.
+
+    Returns:
+        ahocorasick.Automaton: Automaton mapping each keyword to its topic
+    """
+    automaton = ahocorasick.Automaton()
+    for topic, keywords in TOPIC_KEYWORDS.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, topic)
+    automaton.make_automaton()
+    return automaton
+
 
 class VenueResearcher:
     """Researches venue information using Exa.ai."""
@@ -14,6 +54,11 @@ class VenueResearcher:
         """
         self.api_key = api_key
         self.client = Exa(api_key=api_key)
+        self._topic_ac = _topic_automaton()
+
+        # Highlights memoized by normalized venue name, plus in-flight async searches
+        self._research_cache = {}
+        self._inflight = {}
 
     def research_venue(self, venue_name, venue_url, num_results=5):
         """
@@ -27,24 +72,105 @@ class VenueResearcher:
         Returns:
             dict: Venue research information with highlights and key_topics
         """
-        print(f"  Researching: {venue_name}")
+        logger.info(f"  Researching: {venue_name}")
+
+        key = self._research_key(venue_name, num_results)
+        highlights = self._research_cache.get(key)
+        if highlights is None:
+            # Build search query
+            query = self._build_search_query(venue_name)
+
+            # Search with highlights
+            highlights = self._search_with_highlights(query, num_results)
+            self._remember(key, highlights)
+
+        return self._summarize_research(list(highlights))
+
+    async def research_venue_async(self, session, venue_name, venue_url, num_results=5):
+        """
+        Research venue without blocking the event loop.
+
+        Calls the Exa.ai REST endpoint directly through a shared aiohttp
+        session so that many venues can be researched concurrently.
+
+        Args:
+            session: aiohttp.ClientSession used for the request
+            venue_name: Name of the venue
+            venue_url: URL of the venue
+            num_results: Number of search results (default: 5)
+
+        Returns:
+            dict: Venue research information with highlights and key_topics
+        """
+        key = self._research_key(venue_name, num_results)
+        highlights = self._research_cache.get(key)
+        if highlights is None:
+            # Concurrent requests for the same venue share one search
+            task = self._inflight.get(key)
+            if task is None:
+                query = self._build_search_query(venue_name)
+                task = asyncio.ensure_future(
+                    self._search_with_highlights_async(session, query, num_results)
+                )
+                self._inflight[key] = task
+                task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+            # Shield so one cancelled caller does not cancel the search for the others
+            highlights = await asyncio.shield(task)
+            self._remember(key, highlights)
 
-        # Build search query
-        query = self._build_search_query(venue_name)
+        # Print once the results are in so output from concurrent tasks does not interleave
+        logger.info(f"  Researching: {venue_name}")
+        return self._summarize_research(list(highlights))
 
-        # Search with highlights
-        highlights = self._search_with_highlights(query, num_results)
+    @staticmethod
+    def _research_key(venue_name, num_results):
+        """
+        Build the memoization key for a venue search.
 
+        Args:
+            venue_name: Name of the venue
+            num_results: Number of search results
+
+        Returns:
+            tuple: Normalized venue name and num_results
+        """
+        return (venue_name.strip().lower(), num_results)
+
+    def _remember(self, key, highlights):
+        """
+        Memoize search highlights for key.
+
+        Empty results are not stored, since searches report errors as an
+        empty list and should be retried.
+
+        Args:
+            key: Key from _research_key
+            highlights: List of highlight strings
+        """
+        if highlights:
+            self._research_cache[key] = tuple(highlights)
+
+    def _summarize_research(self, highlights):
+        """
+        Extract key topics from highlights and print a short summary.
+
+        Args:
+            highlights: List of highlight strings
+
+        Returns:
+            dict: Venue research information with highlights and key_topics
+        """
         # Extract key topics from highlights
         key_topics = self._extract_key_topics(highlights)
 
         # Print highlights
         if highlights:
-            print(f"    Highlights:")
+            logger.info(f"    Highlights:")
             for i, highlight in enumerate(highlights[:5], 1):  # Show first 5
-                print(f"      {i}. {highlight}")
+                logger.info(f"      {i}. {highlight}")
         else:
-            print(f"    No highlights found")
+            logger.info(f"    No highlights found")
 
         return {
             'highlights': highlights,
@@ -96,7 +222,54 @@ class VenueResearcher:
             return all_highlights
 
         except Exception as e:
-            print(f"    Error during Exa search: {str(e)}")
+            logger.error(f"    Error during Exa search: {str(e)}")
+            return []
+
+    async def _search_with_highlights_async(self, session, query, num_results):
+        """
+        Perform Exa search over aiohttp and extract highlights.
+
+        Args:
+            session: aiohttp.ClientSession used for the request
+            query: Search query
+            num_results: Number of results to retrieve
+
+        Returns:
+            list: List of highlight strings
+        """
+        payload = {
+            "query": query,
+            "type": "neural",
+            "numResults": num_results,
+            "contents": {
+                "highlights": {
+                    "highlightsPerUrl": 3,
+                    "numSentences": 2,
+                    "query": query
+                }
+            }
+        }
+
+        try:
+            async with session.post(
+                EXA_SEARCH_URL,
+                json=payload,
+                headers={"x-api-key": self.api_key},
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                response.raise_for_status()
+                data = await response.json()
+
+            # Collect all highlights
+            all_highlights = []
+            for result in data.get('results', []):
+                if result.get('highlights'):
+                    all_highlights.extend(result['highlights'])
+
+            return all_highlights
+
+        except Exception as e:
+            logger.error(f"    Error during Exa search: {str(e)}")
             return []
 
     def _extract_key_topics(self, highlights):
@@ -107,29 +280,19 @@ class VenueResearcher:
             highlights: List of highlight strings
 
         Returns:
-            list: List of key topic strings
+            list: Key topic strings in sorted order, so prompts built from them are stable across runs
         """
-        topics = set()
-
         # Combine all highlights into one text
         all_text = " ".join(highlights).lower()
 
-        # Topic keywords to look for
-        topic_keywords = {
-            "Machine Learning": ["machine learning", "ml", "deep learning", "neural network"],
-            "Natural Language Processing": ["nlp", "natural language", "language model", "text mining"],
-            "Computer Vision": ["computer vision", "image processing", "visual", "cv"],
-            "AI": ["artificial intelligence", "ai"],
-            "Theory": ["theory", "theoretical", "algorithm"],
-            "Data Science": ["data science", "data mining", "analytics"],
-            "Robotics": ["robotics", "robot", "autonomous"],
-            "Healthcare": ["healthcare", "medical", "clinical", "health"],
-            "Security": ["security", "privacy", "cryptography"],
-            "Systems": ["systems", "distributed", "cloud", "infrastructure"]
-        }
-
-        for topic, keywords in topic_keywords.items():
-            if any(keyword in all_text for keyword in keywords):
-                topics.add(topic)
+        # One pass over the text finds every keyword occurrence; stop early
+        # once every topic has matched
+        topics = set()
+        for _, topic in self._topic_ac.iter(all_text):
+            topics.add(topic)
+            if len(topics) == len(TOPIC_KEYWORDS):
+                break
 
-        return list(topics) if topics else ["General Computer Science"]
+        # Sorted because set order varies between processes (string hash
+        # randomization), which would change the prompt and its cache key
+        return sorted(topics) if topics else ["General Computer Science"]
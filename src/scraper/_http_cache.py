@@ -0,0 +1,69 @@
+"""On-disk cache for fetched conference pages."""
+import os
+import sqlite3
+import threading
+import time
+from typing import NamedTuple, Optional
+
+
+class CachedPage(NamedTuple):
+    """A cached response body with its revalidation headers."""
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+class PageCache:
+    """SQLite-backed store mapping URLs to response bodies and validators."""
+
+    def __init__(self, path: str = '.cache/openreview.sqlite', expire_after: float = 3600):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file
+            expire_after: Seconds a page is served without revalidation (default: 3600)
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.expire_after = expire_after
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS pages ('
+            'url TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, last_modified TEXT, '
+            'fetched_at REAL NOT NULL)'
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """Return the cached page for url, fresh or stale, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT body, etag, last_modified, fetched_at FROM pages WHERE url = ?', (url,)
+            ).fetchone()
+        return CachedPage(*row) if row else None
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        """Return True if page can be served without revalidating it."""
+        # Wall-clock time: fetched_at has to survive across runs
+        return time.time() - page.fetched_at < self.expire_after
+
+    def set(self, url: str, body: bytes, etag: Optional[str], last_modified: Optional[str]) -> None:
+        """Store a freshly fetched page."""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO pages (url, body, etag, last_modified, fetched_at) '
+                'VALUES (?, ?, ?, ?, ?)',
+                (url, body, etag, last_modified, time.time())
+            )
+            self._conn.commit()
+
+    def touch(self, url: str) -> None:
+        """Mark a cached page as fresh again after a 304 Not Modified."""
+        with self._lock:
+            self._conn.execute('UPDATE pages SET fetched_at = ? WHERE url = ?', (time.time(), url))
+            self._conn.commit()
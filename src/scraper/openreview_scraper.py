@@ -1,26 +1,87 @@
 """Scraper for OpenReview.net conferences."""
+import functools
+import logging
 import re
-import time
-import requests
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import ahocorasick
+import httpx
+from selectolax.lexbor import LexborHTMLParser
+
+from src.scraper._http_cache import PageCache
+from src.utils.rate_limiter import TokenBucket
+
+try:
+    import h2  # noqa: F401  (httpx needs it for HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Matched against the raw response bytes; the pattern is ASCII-only so
+# matches decode losslessly
+EMAIL_RE_B = re.compile(rb'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})')
+# Substrings marking system addresses that are never a venue contact
+EXCLUDED_EMAIL_KEYWORDS = ('openreview.net', 'noreply', 'notification', 'no-reply')
+# Conference links on the homepage
+GROUP_LINK_SELECTOR = 'a[href*="/group?id="]'
+MAILTO_SELECTOR = 'a[href^="mailto:"]'
+
+
+@functools.lru_cache(maxsize=8)
+def _exclusion_automaton(keywords):
+    """
+    Build an Aho-Corasick automaton over lowercased exclusion keywords.
+
+    Args:
+        keywords: Tuple of keyword strings
+
+    Returns:
+        ahocorasick.Automaton: Automaton matching any keyword, or None if keywords is empty
+    """
+    if not keywords:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword.lower(), keyword)
+    automaton.make_automaton()
+    return automaton
 
 
 class OpenReviewScraper:
     """Scrapes conference information from OpenReview.net."""
 
-    def __init__(self, delay=1.5):
+    def __init__(self, delay=1.5, max_workers=8, cache_path='.cache/openreview.sqlite',
+                 cache_expire_after=3600, excluded_keywords=EXCLUDED_EMAIL_KEYWORDS):
         """
         Initialize the scraper.
 
         Args:
-            delay: Delay in seconds between requests (default: 1.5)
+            delay: Average delay in seconds between conference page requests; 0 disables it (default: 1.5)
+            max_workers: Conference pages fetched concurrently (default: 8)
+            cache_path: SQLite file caching conference pages, or None to disable (default: .cache/openreview.sqlite)
+            cache_expire_after: Seconds a cached page is reused before revalidating it (default: 3600)
+            excluded_keywords: Substrings that disqualify an email address (default: EXCLUDED_EMAIL_KEYWORDS)
         """
         self.base_url = "https://openreview.net"
         self.delay = delay
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        self.max_workers = max_workers
+        # Shared by all fetch threads so the aggregate request rate stays polite
+        self._bucket = TokenBucket(1 / delay) if delay > 0 else None
+        # One client shared by all fetch threads; with HTTP/2 the requests
+        # multiplex over a single TLS connection to openreview.net
+        self.session = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+            },
+            timeout=30.0,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+        )
+        self.cache = PageCache(cache_path, cache_expire_after) if cache_path else None
+        self._exclude_ac = _exclusion_automaton(tuple(excluded_keywords))
 
     def scrape_open_submissions(self):
         """
@@ -29,59 +90,102 @@ class OpenReviewScraper:
         Returns:
             list: List of conference dictionaries with name, url, and email
         """
-        print(f"Fetching homepage: {self.base_url}")
+        logger.info(f"Fetching homepage: {self.base_url}")
 
         try:
-            response = self.session.get(self.base_url, timeout=30)
+            response = self.session.get(self.base_url)
             response.raise_for_status()
-        except requests.RequestException as e:
-            print(f"Error fetching homepage: {e}")
+        except httpx.HTTPError as e:
+            logger.error(f"Error fetching homepage: {e}")
             return []
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        tree = LexborHTMLParser(response.text)
 
         # Find the "Open for Submissions" section
         open_submissions_section = None
-        for section in soup.find_all('section'):
-            h1 = section.find('h1')
-            if h1 and 'Open for Submissions' in h1.get_text():
+        for section in tree.css('section'):
+            h1 = section.css_first('h1')
+            if h1 is not None and 'Open for Submissions' in h1.text():
                 open_submissions_section = section
                 break
 
-        if not open_submissions_section:
-            print("Could not find 'Open for Submissions' section")
+        if open_submissions_section is None:
+            logger.warning("Could not find 'Open for Submissions' section")
             return []
 
         # Extract all conference links
-        conference_links = open_submissions_section.find_all('a', href=re.compile(r'/group\?id='))
-        print(f"Found {len(conference_links)} conferences")
+        conference_links = open_submissions_section.css(GROUP_LINK_SELECTOR)
+        logger.info(f"Found {len(conference_links)} conferences")
 
         conferences = []
-        for idx, link in enumerate(conference_links, 1):
-            conference_name = link.get_text(strip=True)
-            conference_path = link.get('href')
-            conference_url = self.base_url + conference_path if conference_path.startswith('/') else conference_path
-
-            print(f"[{idx}/{len(conference_links)}] Processing: {conference_name}")
-
-            # Get email from conference page
-            email = self.get_conference_email(conference_url)
-
+        for link in conference_links:
+            conference_path = link.attributes['href']
             conferences.append({
-                'name': conference_name,
-                'url': conference_url,
-                'email': email if email else 'Not found'
+                'name': link.text(strip=True),
+                'url': self.base_url + conference_path if conference_path.startswith('/') else conference_path,
+                'email': self._listing_email(link) or 'Not found'
             })
 
-            # Rate limiting
-            if idx < len(conference_links):
-                time.sleep(self.delay)
+        # Only conferences without a contact in the listing need their own page fetched
+        pending = [conf for conf in conferences if conf['email'] == 'Not found']
+        if len(pending) < len(conferences):
+            logger.info(f"Found {len(conferences) - len(pending)} emails on the homepage")
+
+        # Get emails from conference pages concurrently; results fill in place
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._fetch_email_limited, conf['url']): conf
+                for conf in pending
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                conf = futures[future]
+                email = future.result()
+                if email:
+                    conf['email'] = email
+                logger.info(f"[{done}/{len(pending)}] {conf['name']}: {conf['email']}")
 
         return conferences
 
-    def get_conference_email(self, conference_url):
+    def _listing_email(self, link):
         """
-        Extract email from a specific conference page.
+        Look for a mailto: link in the homepage entry around a conference link.
+
+        Args:
+            link: Conference <a> node from the homepage
+
+        Returns:
+            str: Email address or None if the entry has none
+        """
+        # Climb to the conference's <li> entry without leaving its section
+        entry = link.parent
+        while entry is not None and entry.tag not in ('li', 'section'):
+            entry = entry.parent
+        if entry is None or entry.tag != 'li':
+            return None
+
+        for mailto in entry.css(MAILTO_SELECTOR):
+            email = mailto.attributes.get('href', '')[len('mailto:'):].split('?', 1)[0].strip()
+            if '@' in email and not self._is_excluded(email):
+                return email
+        return None
+
+    def _is_excluded(self, email):
+        """
+        Check an email against the exclusion keywords in one pass.
+
+        Args:
+            email: Email address
+
+        Returns:
+            bool: True if the address contains an excluded keyword
+        """
+        if self._exclude_ac is None:
+            return False
+        return next(self._exclude_ac.iter(email.lower()), None) is not None
+
+    def _fetch_email_limited(self, conference_url):
+        """
+        Fetch the conference email, waiting for a rate-limit token if the page is not cached.
 
         Args:
             conference_url: URL of the conference page
@@ -89,41 +193,84 @@ class OpenReviewScraper:
         Returns:
             str: Email address or None if not found
         """
-        try:
-            response = self.session.get(conference_url, timeout=30)
+        page = self.cache.get(conference_url) if self.cache else None
+        if self._bucket is not None and (page is None or not self.cache.is_fresh(page)):
+            self._bucket.acquire()
+        return self.get_conference_email(conference_url)
+
+    def _fetch_page(self, url):
+        """
+        Fetch a page body through the on-disk cache.
+
+        Fresh cached pages are returned without a request. Stale ones are
+        revalidated with If-None-Match / If-Modified-Since, and still served
+        if the revalidation fails.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            bytes: Response body
+
+        Raises:
+            httpx.HTTPError: The request failed and no cached copy exists
+        """
+        if self.cache is None:
+            response = self.session.get(url)
             response.raise_for_status()
-        except requests.RequestException as e:
-            print(f"  Error fetching {conference_url}: {e}")
-            return None
+            return response.content
 
-        # Extract all emails from the page
-        email_pattern = r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
-        matches = re.findall(email_pattern, response.text)
+        page = self.cache.get(url)
+        if page is not None and self.cache.is_fresh(page):
+            return page.body
 
-        if matches:
-            # Filter out OpenReview system emails
-            excluded_domains = ['openreview.net']
-            excluded_keywords = ['noreply', 'notification', 'no-reply']
+        headers = {}
+        if page is not None:
+            if page.etag:
+                headers['If-None-Match'] = page.etag
+            if page.last_modified:
+                headers['If-Modified-Since'] = page.last_modified
 
-            # Track unique emails to avoid duplicates
-            seen_emails = set()
+        try:
+            response = self.session.get(url, headers=headers)
+            if response.status_code == 304 and page is not None:
+                self.cache.touch(url)
+                return page.body
+            response.raise_for_status()
+        except httpx.HTTPError:
+            if page is not None:
+                return page.body
+            raise
 
-            for email in matches:
-                email_lower = email.lower()
+        self.cache.set(
+            url, response.content, response.headers.get('ETag'), response.headers.get('Last-Modified')
+        )
+        return response.content
 
-                # Skip if already seen
-                if email_lower in seen_emails:
-                    continue
+    def get_conference_email(self, conference_url):
+        """
+        Extract email from a specific conference page.
 
-                # Skip system emails
-                if any(domain in email_lower for domain in excluded_domains):
-                    continue
-                if any(keyword in email_lower for keyword in excluded_keywords):
-                    continue
+        Args:
+            conference_url: URL of the conference page
 
-                seen_emails.add(email_lower)
-                print(f"  Found email: {email}")
-                return email
+        Returns:
+            str: Email address or None if not found
+        """
+        try:
+            content = self._fetch_page(conference_url)
+        except httpx.HTTPError as e:
+            logger.error(f"  Error fetching {conference_url}: {e}")
+            return None
+
+        # Return the first email on the page that is not an OpenReview system address
+        for match in EMAIL_RE_B.finditer(content):
+            email = match.group(1).decode('ascii')
+            if self._is_excluded(email):
+                continue
+
+            logger.info(f"  Found email: {email}")
+            return email
 
-        print(f"  No valid email found")
+        logger.info(f"  No valid email found")
         return None
@@ -1,32 +1,144 @@
-"""CSV handling utilities."""
+"""CSV and JSONL handling utilities."""
 import csv
+import io
+
+import orjson
 
 
 def save_to_csv(data, filename, fieldnames):
     """
     Save data to CSV file.
 
+    Missing keys are written as empty strings and keys not in fieldnames
+    are ignored.
+
     Args:
         data: List of dictionaries
         filename: Output CSV filename
         fieldnames: List of field names
     """
+    rows = (tuple(row.get(key, '') for key in fieldnames) for row in data)
+
+    # Serialize in memory, then hand the file one contiguous write
+    buf = io.StringIO(newline='')
+    writer = csv.writer(buf)
+    writer.writerow(fieldnames)
+    writer.writerows(rows)
+
     with open(filename, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(data)
+        f.write(buf.getvalue())
 
 
 def read_from_csv(filename):
     """
     Read data from CSV file.
 
+    Blank lines are skipped, missing trailing fields are None and surplus
+    fields are collected in a list under the None key, as with csv.DictReader.
+
     Args:
         filename: CSV filename to read
 
     Returns:
         list: List of dictionaries
     """
-    with open(filename, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        return list(reader)
+    with open(filename, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return []
+
+        width = len(header)
+        records = []
+        for row in reader:
+            if not row:
+                continue
+            record = dict(zip(header, row))
+            if len(row) < width:
+                for key in header[len(row):]:
+                    record[key] = None
+            elif len(row) > width:
+                record[None] = row[width:]
+            records.append(record)
+        return records
+
+
+def save_to_jsonl(data, filename):
+    """
+    Save data to a JSON Lines file, one object per line.
+
+    Much faster than CSV for large exports (prefer it above ~100k rows) when
+    the output does not need to open in a spreadsheet.
+
+    Args:
+        data: Iterable of dictionaries
+        filename: Output JSONL filename
+    """
+    with open(filename, 'wb') as f:
+        f.writelines(orjson.dumps(row) + b'\n' for row in data)
+
+
+def read_jsonl(filename):
+    """
+    Read data from a JSON Lines file.
+
+    Args:
+        filename: JSONL filename to read
+
+    Returns:
+        list: List of dictionaries
+    """
+    with open(filename, 'rb') as f:
+        return [orjson.loads(line) for line in f if line.strip()]
+
+
+class CsvStreamWriter:
+    """Context manager that writes CSV rows incrementally as they are produced."""
+
+    def __init__(self, filename, fieldnames, flush_every=50):
+        """
+        Initialize the writer.
+
+        Args:
+            filename: Output CSV filename
+            fieldnames: List of field names
+            flush_every: Flush buffered rows to disk after this many rows (default: 50)
+        """
+        self.filename = filename
+        self.fieldnames = fieldnames
+        self.flush_every = flush_every
+        self.rows_written = 0
+        self._file = None
+        self._writer = None
+
+    def __enter__(self):
+        self._file = open(self.filename, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.fieldnames)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        return False
+
+    def writerow(self, row):
+        """
+        Write a single row, flushing periodically so partial results survive a crash.
+
+        Args:
+            row: Dictionary keyed by fieldnames
+        """
+        self._writer.writerow(tuple(row.get(key, '') for key in self.fieldnames))
+        self.rows_written += 1
+        if self.rows_written % self.flush_every == 0:
+            self._file.flush()
+
+    def writerows(self, rows):
+        """
+        Write multiple rows.
+
+        Args:
+            rows: Iterable of dictionaries keyed by fieldnames
+        """
+        for row in rows:
+            self.writerow(row)
@@ -0,0 +1,42 @@
+"""Conference de-duplication utilities."""
+from urllib.parse import urlsplit, urlunsplit
+
+
+def _canon(url):
+    """
+    Normalize a URL for duplicate detection.
+
+    Lowercases scheme and host, strips trailing slashes from the path and
+    drops the fragment. The query string is kept because OpenReview identifies
+    venues by it (/group?id=...).
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        str: Canonical form of the URL
+    """
+    parts = urlsplit(url.strip())
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip('/'),
+        parts.query,
+        ''
+    ))
+
+
+def dedup_by_url(conferences):
+    """
+    Remove conferences whose URLs point to the same venue.
+
+    Args:
+        conferences: List of conference dictionaries with a 'url' key
+
+    Returns:
+        list: Conferences in original order, keeping the first of each duplicate
+    """
+    seen = {}
+    for conf in conferences:
+        seen.setdefault(_canon(conf['url']), conf)
+    return list(seen.values())
@@ -0,0 +1,46 @@
+"""Logging configuration with a background writer thread."""
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+_listener = None
+
+
+def setup_logging(level=logging.INFO):
+    """
+    Route all log records through a queue drained by a background thread.
+
+    Logging calls on the hot path only enqueue the record; the stdout write
+    happens on the listener thread. Safe to call more than once.
+
+    Args:
+        level: Root logger level (default: logging.INFO)
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue = queue.Queue(-1)
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+
+    _listener = QueueListener(log_queue, handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+    # httpx (also used by the OpenAI SDK) logs every request at INFO
+    for name in ('httpx', 'httpcore'):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+
+def flush_logging():
+    """Block until every queued record has been written, e.g. before prompting for input."""
+    if _listener is not None:
+        _listener.stop()
+        _listener.start()
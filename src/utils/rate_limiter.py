@@ -0,0 +1,50 @@
+"""Thread-safe token-bucket rate limiter."""
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket shared by concurrent callers.
+
+    Credit accumulated while idle (up to capacity) lets a burst go out
+    back-to-back. When the bucket is empty the token is borrowed against
+    future refills, so concurrent callers queue up in call order.
+    """
+
+    def __init__(self, rate, capacity=1):
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate: Sustained tokens per second
+            capacity: Maximum tokens held, i.e. calls allowed back-to-back after idling (default: 1)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Take one token from the bucket.
+
+        Returns:
+            float: Seconds the caller must wait before proceeding
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        """Take one token, sleeping until it is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)